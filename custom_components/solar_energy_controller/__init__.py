@@ -1,167 +1,233 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
+from functools import lru_cache, partial
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryError, ConfigEntryNotReady
-from homeassistant.core import HomeAssistant, Event
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.components.http import StaticPathConfig
 
-from .const import DOMAIN, PLATFORMS
-from .coordinator import SolarEnergyFlowCoordinator
+from .const import (
+    CONF_GRID_POWER_ENTITY,
+    CONF_OUTPUT_ENTITY,
+    CONF_PROCESS_VALUE_ENTITY,
+    CONF_SETPOINT_ENTITY,
+    DOMAIN,
+    PLATFORMS,
+)
+from .coordinator import SolarEnergyFlowCoordinator, get_entity_id
 
 _LOGGER = logging.getLogger(__name__)
 
 type SolarEnergyControllerConfigEntry = ConfigEntry[SolarEnergyFlowCoordinator]
 
+# Required wiring entities and the names used for them in setup errors
+_ENTITY_LABELS: dict[str, str] = {
+    CONF_PROCESS_VALUE_ENTITY: "Process Value",
+    CONF_SETPOINT_ENTITY: "Setpoint",
+    CONF_OUTPUT_ENTITY: "Output",
+    CONF_GRID_POWER_ENTITY: "Grid Power",
+}
+
+_UNAVAILABLE_STATES = frozenset(("unavailable", "unknown"))
+
+# Used when manifest.json cannot be read; keep in sync with manifest.json
+_FALLBACK_VERSION = "1.0.0"
+_MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "manifest.json")
+_FRONTEND_PATH = os.path.join(os.path.dirname(__file__), "frontend")
+
+# Card scripts shipped in frontend/ and registered as Lovelace resources
+_FRONTEND_CARDS: tuple[tuple[str, str], ...] = (
+    ("pid-controller-mini.js", "module"),
+    ("pid-controller-popup.js", "module"),
+)
+
+
+@lru_cache(maxsize=1)
+def _read_manifest_version() -> str:
+    """Return the integration version from manifest.json.
+
+    Successful reads are cached for the lifetime of the process; failures raise
+    and are retried on the next call.
+    """
+    with open(_MANIFEST_PATH, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    return manifest.get("version", _FALLBACK_VERSION)
+
+
+def _get_frontend_info() -> tuple[dict[str, str], str | None]:
+    """Return a version token per card script and the frontend directory, if present.
+
+    The card files are served with cache headers, so each token carries a hash
+    of the script; a changed card gets a new URL even if the manifest version
+    was not bumped. Runs in the executor since it touches the filesystem.
+    """
+    try:
+        version = _read_manifest_version()
+    except (OSError, ValueError):
+        version = _FALLBACK_VERSION
+
+    if not os.path.isdir(_FRONTEND_PATH):
+        _LOGGER.warning("Solar Energy Controller: Frontend directory not found: %s", _FRONTEND_PATH)
+        return {name: version for name, _ in _FRONTEND_CARDS}, None
+
+    tokens: dict[str, str] = {}
+    for name, _ in _FRONTEND_CARDS:
+        try:
+            with open(os.path.join(_FRONTEND_PATH, name), "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            tokens[name] = version
+        else:
+            tokens[name] = f"{version}-{digest[:8]}"
+    return tokens, _FRONTEND_PATH
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     _LOGGER.info("Solar Energy Controller: Initializing integration")
     
-    version = "1.0.0"
-    try:
-        import json
-        
-        def read_manifest():
-            manifest_path = os.path.join(os.path.dirname(__file__), "manifest.json")
-            if os.path.exists(manifest_path):
-                with open(manifest_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            return None
-        
-        manifest = await hass.async_add_executor_job(read_manifest)
-        if manifest:
-            version = manifest.get("version", version)
-    except Exception:
-        pass
-    
-    frontend_path = os.path.join(os.path.dirname(__file__), "frontend")
-    if os.path.isdir(frontend_path):
+    tokens, frontend_path = await hass.async_add_executor_job(_get_frontend_info)
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if frontend_path is not None and not domain_data.get("static_registered"):
         await hass.http.async_register_static_paths([
             StaticPathConfig(
                 url_path=f"/{DOMAIN}/frontend",
                 path=frontend_path,
-                cache_headers=False
+                cache_headers=True
             )
         ])
+        domain_data["static_registered"] = True
         _LOGGER.info("Solar Energy Controller: Registered static path: /%s/frontend -> %s", DOMAIN, frontend_path)
+
+    resources = tuple(
+        {"url": f"/{DOMAIN}/frontend/{name}?v={tokens[name]}", "res_type": res_type}
+        for name, res_type in _FRONTEND_CARDS
+    )
+
+    # When the integration is first loaded after startup (e.g. the first entry is
+    # added from the UI) the started event has already fired
+    if hass.state is CoreState.running:
+        _schedule_register_resources(hass, resources)
     else:
-        _LOGGER.warning("Solar Energy Controller: Frontend directory not found: %s", frontend_path)
-
-    async def register_resources(_event: Event) -> None:
-        _LOGGER.info("Attempting to register Lovelace resources for %s", DOMAIN)
-
-        resources = [
-            {
-                "url": f"/{DOMAIN}/frontend/pid-controller-mini.js?v={version}",
-                "res_type": "module",
-            },
-            {
-                "url": f"/{DOMAIN}/frontend/pid-controller-popup.js?v={version}",
-                "res_type": "module",
-            },
-        ]
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STARTED, partial(_schedule_register_resources, hass, resources)
+        )
+    return True
+
+
+@callback
+def _schedule_register_resources(
+    hass: HomeAssistant, resources: tuple[dict[str, str], ...], _event: Event | None = None
+) -> None:
+    # Nothing waits on the Lovelace resources, so keep them out of startup tracking
+    hass.async_create_background_task(
+        _register_resources(hass, resources), f"{DOMAIN}_register_lovelace_resources"
+    )
 
-        try:
-            import asyncio
-            await asyncio.sleep(1)
-            
-            lovelace_obj = None
-            if hasattr(hass, "lovelace"):
-                lovelace_obj = hass.lovelace
-            elif "lovelace" in hass.data:
-                lovelace_obj = hass.data["lovelace"]
-            if not lovelace_obj:
-                _LOGGER.warning(
-                    "Lovelace not available. Please add cards manually: "
-                    "Settings → Dashboards → Resources. URLs: %s",
-                    [r["url"] for r in resources]
-                )
-                return
-            
-            lovelace_mode = getattr(lovelace_obj, "mode", None)
-            if lovelace_mode != "storage":
-                _LOGGER.info(
-                    "Lovelace is in %s mode. Auto-registration only works in storage mode. "
-                    "Please add cards manually: %s",
-                    lovelace_mode, [r["url"] for r in resources]
-                )
-                return
-            
-            existing_resources = []
-            try:
-                resources_api = lovelace_obj.resources
-                existing_items = resources_api.async_items()
-                existing_resources = [
-                    item.get("url", "") if isinstance(item, dict) else str(item)
-                    for item in existing_items
-                    if item
-                ]
-            except Exception as err:
-                _LOGGER.debug("Could not get existing resources: %s", err)
 
-            registered_count = 0
-            for resource in resources:
-                resource_url = resource["url"]
-                url_base = resource_url.split("?")[0]
-                if any(url_base in existing for existing in existing_resources):
-                    _LOGGER.debug("Lovelace resource already exists: %s", url_base)
-                    continue
+async def _register_resources(hass: HomeAssistant, resources: tuple[dict[str, str], ...]) -> None:
+    """Add the card resources to Lovelace when it runs in storage mode."""
+    _LOGGER.info("Attempting to register Lovelace resources for %s", DOMAIN)
+
+    try:
+        lovelace_obj = None
+        if hasattr(hass, "lovelace"):
+            lovelace_obj = hass.lovelace
+        elif "lovelace" in hass.data:
+            lovelace_obj = hass.data["lovelace"]
+        if not lovelace_obj:
+            _LOGGER.warning(
+                "Lovelace not available. Please add cards manually: "
+                "Settings → Dashboards → Resources. URLs: %s",
+                [r["url"] for r in resources]
+            )
+            return
+
+        lovelace_mode = getattr(lovelace_obj, "mode", None)
+        if lovelace_mode != "storage":
+            _LOGGER.info(
+                "Lovelace is in %s mode. Auto-registration only works in storage mode. "
+                "Please add cards manually: %s",
+                lovelace_mode, [r["url"] for r in resources]
+            )
+            return
 
-                try:
+        # Compare on the URL without its query string so a version bump
+        # updates the existing resource instead of registering the card twice.
+        existing: dict[str, dict] = {}
+        try:
+            resources_api = lovelace_obj.resources
+            existing = {
+                item.get("url", "").split("?")[0]: item
+                for item in resources_api.async_items()
+                if isinstance(item, dict)
+            }
+        except Exception as err:
+            _LOGGER.debug("Could not get existing resources: %s", err)
+
+        if all(
+            existing.get(r["url"].split("?")[0], {}).get("url") == r["url"] for r in resources
+        ):
+            _LOGGER.debug("All Lovelace resources for %s already registered", DOMAIN)
+            return
+
+        registered_count = 0
+        for resource in resources:
+            resource_url = resource["url"]
+            url_base = resource_url.split("?")[0]
+            item = existing.get(url_base)
+            if item is not None and item.get("url") == resource_url:
+                _LOGGER.debug("Lovelace resource already exists: %s", url_base)
+                continue
+
+            try:
+                if item is not None:
+                    # The card files are served with cache headers, so the
+                    # versioned URL has to follow the installed version
+                    await resources_api.async_update_item(item["id"], {"url": resource_url})
+                    _LOGGER.info("✓ Updated Lovelace resource: %s", resource_url)
+                else:
                     await resources_api.async_create_item(
                         {"url": resource_url, "res_type": resource["res_type"]}
                     )
                     _LOGGER.info(
                         "✓ Registered Lovelace resource: %s (%s)", resource_url, resource["res_type"]
                     )
-                    registered_count += 1
-                except Exception as err:
-                    _LOGGER.warning(
-                        "Failed to register Lovelace resource %s: %s", resource_url, err
-                    )
-            
-            if registered_count > 0:
-                _LOGGER.info("Successfully registered %d Lovelace resource(s) for %s", registered_count, DOMAIN)
-            else:
-                _LOGGER.debug("All resources already registered or registration skipped")
-                
-        except Exception as err:
-            _LOGGER.warning(
-                "Error accessing Lovelace resources API: %s. Please add cards manually: "
-                "Settings → Dashboards → Resources. URLs: %s",
-                err, [r["url"] for r in resources]
-            )
+                registered_count += 1
+            except Exception as err:
+                _LOGGER.warning(
+                    "Failed to register Lovelace resource %s: %s", resource_url, err
+                )
 
-    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, register_resources)
-    return True
+        if registered_count > 0:
+            _LOGGER.info("Successfully registered %d Lovelace resource(s) for %s", registered_count, DOMAIN)
+        else:
+            _LOGGER.debug("All resources already registered or registration skipped")
+
+    except Exception as err:
+        _LOGGER.warning(
+            "Error accessing Lovelace resources API: %s. Please add cards manually: "
+            "Settings → Dashboards → Resources. URLs: %s",
+            err, [r["url"] for r in resources]
+        )
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerConfigEntry) -> bool:
     """Set up Solar Energy Controller from a config entry."""
-    from .const import (
-        CONF_PROCESS_VALUE_ENTITY,
-        CONF_SETPOINT_ENTITY,
-        CONF_OUTPUT_ENTITY,
-        CONF_GRID_POWER_ENTITY,
-    )
-
     # Validate that all required entities exist and are accessible
     # Check both entry.data and entry.options (entities can be in either)
-    required_entities = {
-        CONF_PROCESS_VALUE_ENTITY: entry.options.get(CONF_PROCESS_VALUE_ENTITY) or entry.data.get(CONF_PROCESS_VALUE_ENTITY),
-        CONF_SETPOINT_ENTITY: entry.options.get(CONF_SETPOINT_ENTITY) or entry.data.get(CONF_SETPOINT_ENTITY),
-        CONF_OUTPUT_ENTITY: entry.options.get(CONF_OUTPUT_ENTITY) or entry.data.get(CONF_OUTPUT_ENTITY),
-        CONF_GRID_POWER_ENTITY: entry.options.get(CONF_GRID_POWER_ENTITY) or entry.data.get(CONF_GRID_POWER_ENTITY),
-    }
-
     missing_entities = []
     unavailable_entities = []
 
-    for key, entity_id in required_entities.items():
+    for key in _ENTITY_LABELS:
+        entity_id = get_entity_id(entry, key)
         if not entity_id:
             missing_entities.append(key)
             continue
@@ -169,30 +235,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerCon
         state = hass.states.get(entity_id)
         if state is None:
             missing_entities.append(key)
-        elif state.state in ("unavailable", "unknown"):
+        elif state.state in _UNAVAILABLE_STATES:
             unavailable_entities.append(key)
 
     if missing_entities:
-        entity_names = {
-            CONF_PROCESS_VALUE_ENTITY: "Process Value",
-            CONF_SETPOINT_ENTITY: "Setpoint",
-            CONF_OUTPUT_ENTITY: "Output",
-            CONF_GRID_POWER_ENTITY: "Grid Power",
-        }
-        missing_names = [entity_names[key] for key in missing_entities]
+        missing_names = [_ENTITY_LABELS[key] for key in missing_entities]
         raise ConfigEntryError(
             f"Required entities not found: {', '.join(missing_names)}. "
             "Please check your configuration and ensure all entities exist."
         )
 
     if unavailable_entities:
-        entity_names = {
-            CONF_PROCESS_VALUE_ENTITY: "Process Value",
-            CONF_SETPOINT_ENTITY: "Setpoint",
-            CONF_OUTPUT_ENTITY: "Output",
-            CONF_GRID_POWER_ENTITY: "Grid Power",
-        }
-        unavailable_names = [entity_names[key] for key in unavailable_entities]
+        unavailable_names = [_ENTITY_LABELS[key] for key in unavailable_entities]
         raise ConfigEntryNotReady(
             f"Required entities are unavailable: {', '.join(unavailable_names)}. "
             "Please ensure the entities are working and try again."
@@ -223,13 +277,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerCon
 
 async def _update_listener(hass: HomeAssistant, entry: SolarEnergyControllerConfigEntry) -> None:
     coordinator = entry.runtime_data
-    new_options = dict(entry.options)
     old_options = coordinator.options_cache
 
-    if old_options == new_options:
+    # Compare against the read-only mapping first so the common no-change case skips the copy
+    if entry.options == old_options:
         _LOGGER.debug("Options unchanged for %s; skipping handling", entry.entry_id)
         return
 
+    new_options = dict(entry.options)
     coordinator.options_cache = new_options
 
     if coordinator.options_require_reload(old_options, new_options):
@@ -242,5 +297,6 @@ async def _update_listener(hass: HomeAssistant, entry: SolarEnergyControllerConf
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: SolarEnergyControllerConfigEntry) -> bool:
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    return unload_ok
+    # Per-entry state lives in entry.runtime_data, which HA drops on unload;
+    # hass.data[DOMAIN] only holds integration-wide flags.
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
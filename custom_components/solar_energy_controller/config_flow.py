@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
+from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -71,16 +73,132 @@ from .const import (
     PID_MODE_REVERSE,
 )
 
-_PV_DOMAINS = {"sensor", "number", "input_number"}
-_SETPOINT_DOMAINS = {"number", "input_number"}
-_OUTPUT_DOMAINS = {"number", "input_number"}
-_GRID_DOMAINS = {"sensor", "number", "input_number"}
+_PV_DOMAINS = frozenset({"sensor", "number", "input_number"})
+_SETPOINT_DOMAINS = frozenset({"number", "input_number"})
+_OUTPUT_DOMAINS = frozenset({"number", "input_number"})
+_GRID_DOMAINS = frozenset({"sensor", "number", "input_number"})
+
+# Entity states rejected by the connection check
+_UNAVAILABLE_STATES = frozenset(("unavailable", "unknown"))
+
+# Selector configs take lists; build them once instead of per form render
+_PV_DOMAINS_LIST = sorted(_PV_DOMAINS)
+_SETPOINT_DOMAINS_LIST = sorted(_SETPOINT_DOMAINS)
+_OUTPUT_DOMAINS_LIST = sorted(_OUTPUT_DOMAINS)
+_GRID_DOMAINS_LIST = sorted(_GRID_DOMAINS)
+
+# Validators shared by the config and options flow schemas
+_PV_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain=_PV_DOMAINS_LIST))
+_SETPOINT_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain=_SETPOINT_DOMAINS_LIST))
+_OUTPUT_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain=_OUTPUT_DOMAINS_LIST))
+_GRID_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain=_GRID_DOMAINS_LIST))
+_COERCE_FLOAT = vol.Coerce(float)
+_UPDATE_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1))
+# Ordered: vol.In's container becomes the option list of the form's select
+_PID_MODES = (PID_MODE_DIRECT, PID_MODE_REVERSE)
+_PID_MODE_VALIDATOR = vol.In(_PID_MODES)
+
+# (min key, max key, options flow error) for each configured range
+_RANGES = (
+    (CONF_PV_MIN, CONF_PV_MAX, "invalid_pv_range"),
+    (CONF_SP_MIN, CONF_SP_MAX, "invalid_sp_range"),
+    (CONF_GRID_MIN, CONF_GRID_MAX, "invalid_grid_range"),
+)
 
+# (option key, options flow error) for preserved values that must not be negative
+_NON_NEGATIVE = (
+    (CONF_MAX_OUTPUT_STEP, "invalid_max_output_step"),
+    (CONF_OUTPUT_EPSILON, "invalid_output_epsilon"),
+)
 
+# Stored options the options form does not show, kept across saves
+_PRESERVED_DEFAULTS = {
+    CONF_ENABLED: DEFAULT_ENABLED,
+    CONF_KP: DEFAULT_KP,
+    CONF_KI: DEFAULT_KI,
+    CONF_KD: DEFAULT_KD,
+    CONF_MIN_OUTPUT: DEFAULT_MIN_OUTPUT,
+    CONF_MAX_OUTPUT: DEFAULT_MAX_OUTPUT,
+    CONF_GRID_LIMITER_ENABLED: DEFAULT_GRID_LIMITER_ENABLED,
+    CONF_GRID_LIMITER_TYPE: DEFAULT_GRID_LIMITER_TYPE,
+    CONF_GRID_LIMITER_LIMIT_W: DEFAULT_GRID_LIMITER_LIMIT_W,
+    CONF_GRID_LIMITER_DEADBAND_W: DEFAULT_GRID_LIMITER_DEADBAND_W,
+    CONF_PID_DEADBAND: DEFAULT_PID_DEADBAND,
+    CONF_RATE_LIMITER_ENABLED: DEFAULT_RATE_LIMITER_ENABLED,
+    CONF_RATE_LIMIT: DEFAULT_RATE_LIMIT,
+    CONF_MAX_OUTPUT_STEP: DEFAULT_MAX_OUTPUT_STEP,
+    CONF_OUTPUT_EPSILON: DEFAULT_OUTPUT_EPSILON,
+}
+
+# Options form fields with a plain stored-or-default value
+_FORM_DEFAULTS = {
+    CONF_PROCESS_VALUE_ENTITY: "",
+    CONF_SETPOINT_ENTITY: "",
+    CONF_OUTPUT_ENTITY: "",
+    CONF_GRID_POWER_ENTITY: "",
+    CONF_INVERT_PV: DEFAULT_INVERT_PV,
+    CONF_INVERT_SP: DEFAULT_INVERT_SP,
+    CONF_GRID_POWER_INVERT: DEFAULT_GRID_POWER_INVERT,
+    CONF_PV_MIN: DEFAULT_PV_MIN,
+    CONF_PV_MAX: DEFAULT_PV_MAX,
+    CONF_SP_MIN: DEFAULT_SP_MIN,
+    CONF_SP_MAX: DEFAULT_SP_MAX,
+    CONF_GRID_MIN: DEFAULT_GRID_MIN,
+    CONF_GRID_MAX: DEFAULT_GRID_MAX,
+}
+
+# Every field on the options form
+_OPTIONS_FORM_KEYS = (*_FORM_DEFAULTS, CONF_PID_MODE, CONF_UPDATE_INTERVAL)
+
+
+@lru_cache(maxsize=512)
 def _extract_domain(entity_id: str | None) -> str | None:
-    if not entity_id or "." not in entity_id:
+    if not entity_id:
         return None
-    return entity_id.split(".", 1)[0]
+    domain, sep, _ = entity_id.partition(".")
+    return domain if sep else None
+
+
+def _validate_range(min_val, max_val) -> bool:
+    try:
+        min_f = float(min_val)
+        max_f = float(max_val)
+    except (TypeError, ValueError):
+        return False
+    return max_f > min_f
+
+
+def _validate_non_negative(value) -> bool:
+    try:
+        value_f = float(value)
+    except (TypeError, ValueError):
+        return False
+    return value_f >= 0
+
+
+@lru_cache(maxsize=32)
+def _options_schema(default_items: tuple[tuple[str, Any], ...]) -> vol.Schema:
+    """Return the options form schema for the given (key, default) pairs."""
+    defaults = dict(default_items)
+    return vol.Schema(
+        {
+            vol.Required(CONF_PROCESS_VALUE_ENTITY, default=defaults[CONF_PROCESS_VALUE_ENTITY]): _PV_SELECTOR,
+            vol.Required(CONF_SETPOINT_ENTITY, default=defaults[CONF_SETPOINT_ENTITY]): _SETPOINT_SELECTOR,
+            vol.Required(CONF_OUTPUT_ENTITY, default=defaults[CONF_OUTPUT_ENTITY]): _OUTPUT_SELECTOR,
+            vol.Required(CONF_GRID_POWER_ENTITY, default=defaults[CONF_GRID_POWER_ENTITY]): _GRID_SELECTOR,
+            vol.Optional(CONF_INVERT_PV, default=defaults[CONF_INVERT_PV]): bool,
+            vol.Optional(CONF_INVERT_SP, default=defaults[CONF_INVERT_SP]): bool,
+            vol.Optional(CONF_GRID_POWER_INVERT, default=defaults[CONF_GRID_POWER_INVERT]): bool,
+            vol.Optional(CONF_PID_MODE, default=defaults[CONF_PID_MODE]): _PID_MODE_VALIDATOR,
+            vol.Optional(CONF_UPDATE_INTERVAL, default=defaults[CONF_UPDATE_INTERVAL]): _UPDATE_INTERVAL_VALIDATOR,
+            vol.Required(CONF_PV_MIN, default=defaults[CONF_PV_MIN]): _COERCE_FLOAT,
+            vol.Required(CONF_PV_MAX, default=defaults[CONF_PV_MAX]): _COERCE_FLOAT,
+            vol.Required(CONF_SP_MIN, default=defaults[CONF_SP_MIN]): _COERCE_FLOAT,
+            vol.Required(CONF_SP_MAX, default=defaults[CONF_SP_MAX]): _COERCE_FLOAT,
+            vol.Required(CONF_GRID_MIN, default=defaults[CONF_GRID_MIN]): _COERCE_FLOAT,
+            vol.Required(CONF_GRID_MAX, default=defaults[CONF_GRID_MAX]): _COERCE_FLOAT,
+        }
+    )
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -103,21 +221,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if grid_domain not in _GRID_DOMAINS:
                 errors[CONF_GRID_POWER_ENTITY] = "invalid_grid_domain"
 
-            range_valid = True
-            try:
-                pv_min = float(user_input[CONF_PV_MIN])
-                pv_max = float(user_input[CONF_PV_MAX])
-                sp_min = float(user_input[CONF_SP_MIN])
-                sp_max = float(user_input[CONF_SP_MAX])
-                grid_min = float(user_input[CONF_GRID_MIN])
-                grid_max = float(user_input[CONF_GRID_MAX])
-            except (TypeError, ValueError):
-                range_valid = False
-            else:
-                if pv_max <= pv_min or sp_max <= sp_min or grid_max <= grid_min:
-                    range_valid = False
-
-            if not range_valid:
+            if not all(
+                _validate_range(user_input[min_key], user_input[max_key])
+                for min_key, max_key, _ in _RANGES
+            ):
                 errors["base"] = "invalid_range"
 
             if not errors:
@@ -135,7 +242,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         pv_state = self.hass.states.get(pv_entity)
                         if pv_state is None:
                             errors[CONF_PROCESS_VALUE_ENTITY] = "entity_not_found"
-                        elif pv_state.state in ("unavailable", "unknown"):
+                        elif pv_state.state in _UNAVAILABLE_STATES:
                             errors[CONF_PROCESS_VALUE_ENTITY] = "entity_unavailable"
 
                     if not sp_entity:
@@ -144,7 +251,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         sp_state = self.hass.states.get(sp_entity)
                         if sp_state is None:
                             errors[CONF_SETPOINT_ENTITY] = "entity_not_found"
-                        elif sp_state.state in ("unavailable", "unknown"):
+                        elif sp_state.state in _UNAVAILABLE_STATES:
                             errors[CONF_SETPOINT_ENTITY] = "entity_unavailable"
 
                     if not output_entity:
@@ -153,7 +260,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         output_state = self.hass.states.get(output_entity)
                         if output_state is None:
                             errors[CONF_OUTPUT_ENTITY] = "entity_not_found"
-                        elif output_state.state in ("unavailable", "unknown"):
+                        elif output_state.state in _UNAVAILABLE_STATES:
                             errors[CONF_OUTPUT_ENTITY] = "entity_unavailable"
 
                     if not grid_entity:
@@ -162,7 +269,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         grid_state = self.hass.states.get(grid_entity)
                         if grid_state is None:
                             errors[CONF_GRID_POWER_ENTITY] = "entity_not_found"
-                        elif grid_state.state in ("unavailable", "unknown"):
+                        elif grid_state.state in _UNAVAILABLE_STATES:
                             errors[CONF_GRID_POWER_ENTITY] = "entity_unavailable"
                 except KeyError as e:
                     # Missing required field
@@ -194,28 +301,22 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return SolarEnergyFlowOptionsFlowHandler(config_entry)
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def _build_user_schema() -> vol.Schema:
+        """Return the user step schema; it only depends on module constants."""
         return vol.Schema(
             {
                 vol.Required(CONF_NAME): str,
-                vol.Required(CONF_PROCESS_VALUE_ENTITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=list(_PV_DOMAINS))
-                ),
-                vol.Required(CONF_SETPOINT_ENTITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=list(_SETPOINT_DOMAINS))
-                ),
-                vol.Required(CONF_OUTPUT_ENTITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=list(_OUTPUT_DOMAINS))
-                ),
-                vol.Required(CONF_GRID_POWER_ENTITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=list(_GRID_DOMAINS))
-                ),
-                vol.Required(CONF_PV_MIN, default=DEFAULT_PV_MIN): vol.Coerce(float),
-                vol.Required(CONF_PV_MAX, default=DEFAULT_PV_MAX): vol.Coerce(float),
-                vol.Required(CONF_SP_MIN, default=DEFAULT_SP_MIN): vol.Coerce(float),
-                vol.Required(CONF_SP_MAX, default=DEFAULT_SP_MAX): vol.Coerce(float),
-                vol.Required(CONF_GRID_MIN, default=DEFAULT_GRID_MIN): vol.Coerce(float),
-                vol.Required(CONF_GRID_MAX, default=DEFAULT_GRID_MAX): vol.Coerce(float),
+                vol.Required(CONF_PROCESS_VALUE_ENTITY): _PV_SELECTOR,
+                vol.Required(CONF_SETPOINT_ENTITY): _SETPOINT_SELECTOR,
+                vol.Required(CONF_OUTPUT_ENTITY): _OUTPUT_SELECTOR,
+                vol.Required(CONF_GRID_POWER_ENTITY): _GRID_SELECTOR,
+                vol.Required(CONF_PV_MIN, default=DEFAULT_PV_MIN): _COERCE_FLOAT,
+                vol.Required(CONF_PV_MAX, default=DEFAULT_PV_MAX): _COERCE_FLOAT,
+                vol.Required(CONF_SP_MIN, default=DEFAULT_SP_MIN): _COERCE_FLOAT,
+                vol.Required(CONF_SP_MAX, default=DEFAULT_SP_MAX): _COERCE_FLOAT,
+                vol.Required(CONF_GRID_MIN, default=DEFAULT_GRID_MIN): _COERCE_FLOAT,
+                vol.Required(CONF_GRID_MAX, default=DEFAULT_GRID_MAX): _COERCE_FLOAT,
             }
         )
 
@@ -233,140 +334,47 @@ class SolarEnergyFlowOptionsFlowHandler(config_entries.OptionsFlow):
             int_val = int(value)
         except (TypeError, ValueError):
             return default
-        return max(min_value, int_val)
+        return int_val if int_val >= min_value else min_value
 
     @staticmethod
     def _normalize_pid_mode(value: str | None) -> str:
-        if value in (PID_MODE_DIRECT, PID_MODE_REVERSE):
+        if value in _PID_MODES:
             return value
         return DEFAULT_PID_MODE
 
-    @staticmethod
-    def _validate_range(min_val, max_val) -> bool:
-        try:
-            min_f = float(min_val)
-            max_f = float(max_val)
-        except (TypeError, ValueError):
-            return False
-        return max_f > min_f
-
     @staticmethod
     def _build_schema(defaults: dict) -> vol.Schema:
-        return vol.Schema(
-            {
-                vol.Required(CONF_PROCESS_VALUE_ENTITY, default=defaults[CONF_PROCESS_VALUE_ENTITY]): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=list(_PV_DOMAINS))
-                ),
-                vol.Required(CONF_SETPOINT_ENTITY, default=defaults[CONF_SETPOINT_ENTITY]): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=list(_SETPOINT_DOMAINS))
-                ),
-                vol.Required(CONF_OUTPUT_ENTITY, default=defaults[CONF_OUTPUT_ENTITY]): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=list(_OUTPUT_DOMAINS))
-                ),
-                vol.Required(CONF_GRID_POWER_ENTITY, default=defaults[CONF_GRID_POWER_ENTITY]): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=list(_GRID_DOMAINS))
-                ),
-                vol.Optional(CONF_INVERT_PV, default=defaults.get(CONF_INVERT_PV, DEFAULT_INVERT_PV)): bool,
-                vol.Optional(CONF_INVERT_SP, default=defaults.get(CONF_INVERT_SP, DEFAULT_INVERT_SP)): bool,
-                vol.Optional(
-                    CONF_GRID_POWER_INVERT,
-                    default=defaults.get(CONF_GRID_POWER_INVERT, DEFAULT_GRID_POWER_INVERT),
-                ): bool,
-                vol.Optional(
-                    CONF_PID_MODE,
-                    default=defaults.get(CONF_PID_MODE, DEFAULT_PID_MODE),
-                ): vol.In([PID_MODE_DIRECT, PID_MODE_REVERSE]),
-                vol.Optional(
-                    CONF_UPDATE_INTERVAL,
-                    default=defaults.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
-                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
-                vol.Required(CONF_PV_MIN, default=defaults[CONF_PV_MIN]): vol.Coerce(float),
-                vol.Required(CONF_PV_MAX, default=defaults[CONF_PV_MAX]): vol.Coerce(float),
-                vol.Required(CONF_SP_MIN, default=defaults[CONF_SP_MIN]): vol.Coerce(float),
-                vol.Required(CONF_SP_MAX, default=defaults[CONF_SP_MAX]): vol.Coerce(float),
-                vol.Required(CONF_GRID_MIN, default=defaults[CONF_GRID_MIN]): vol.Coerce(float),
-                vol.Required(CONF_GRID_MAX, default=defaults[CONF_GRID_MAX]): vol.Coerce(float),
-            }
+        # Only the defaults change between renders; reuse the schema built for them
+        return _options_schema(tuple(defaults.items()))
+
+    def _form_defaults(self) -> dict:
+        """Return the values the options form is rendered with."""
+        o = self._config_entry.options
+        # Options win over the values stored at setup time
+        merged = {**self._config_entry.data, **o}
+
+        defaults = {key: merged.get(key, default) for key, default in _FORM_DEFAULTS.items()}
+        defaults[CONF_PID_MODE] = self._normalize_pid_mode(o.get(CONF_PID_MODE))
+        defaults[CONF_UPDATE_INTERVAL] = self._coerce_int(
+            o.get(CONF_UPDATE_INTERVAL),
+            DEFAULT_UPDATE_INTERVAL,
+            min_value=1,
         )
+        return defaults
 
     async def async_step_init(self, user_input=None):
-        o = self._config_entry.options
         errors: dict[str, str] = {}
 
-        # Keep previously stored tuning values even though they are no longer exposed in the form.
-        preserved = {
-            CONF_ENABLED: o.get(CONF_ENABLED, DEFAULT_ENABLED),
-            CONF_KP: o.get(CONF_KP, DEFAULT_KP),
-            CONF_KI: o.get(CONF_KI, DEFAULT_KI),
-            CONF_KD: o.get(CONF_KD, DEFAULT_KD),
-            CONF_MIN_OUTPUT: o.get(CONF_MIN_OUTPUT, DEFAULT_MIN_OUTPUT),
-            CONF_MAX_OUTPUT: o.get(CONF_MAX_OUTPUT, DEFAULT_MAX_OUTPUT),
-            CONF_GRID_LIMITER_ENABLED: o.get(CONF_GRID_LIMITER_ENABLED, DEFAULT_GRID_LIMITER_ENABLED),
-            CONF_GRID_LIMITER_TYPE: o.get(CONF_GRID_LIMITER_TYPE, DEFAULT_GRID_LIMITER_TYPE),
-            CONF_GRID_LIMITER_LIMIT_W: o.get(CONF_GRID_LIMITER_LIMIT_W, DEFAULT_GRID_LIMITER_LIMIT_W),
-            CONF_GRID_LIMITER_DEADBAND_W: o.get(
-                CONF_GRID_LIMITER_DEADBAND_W, DEFAULT_GRID_LIMITER_DEADBAND_W
-            ),
-            CONF_PID_DEADBAND: o.get(CONF_PID_DEADBAND, DEFAULT_PID_DEADBAND),
-            CONF_RATE_LIMITER_ENABLED: o.get(CONF_RATE_LIMITER_ENABLED, DEFAULT_RATE_LIMITER_ENABLED),
-            CONF_RATE_LIMIT: o.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
-            CONF_MAX_OUTPUT_STEP: o.get(CONF_MAX_OUTPUT_STEP, DEFAULT_MAX_OUTPUT_STEP),
-            CONF_OUTPUT_EPSILON: o.get(CONF_OUTPUT_EPSILON, DEFAULT_OUTPUT_EPSILON),
-            CONF_GRID_POWER_ENTITY: o.get(
-                CONF_GRID_POWER_ENTITY, self._config_entry.data.get(CONF_GRID_POWER_ENTITY, "")
-            ),
-        }
+        if user_input is not None:
+            o = self._config_entry.options
 
-        defaults = {
-            CONF_PROCESS_VALUE_ENTITY: o.get(
-                CONF_PROCESS_VALUE_ENTITY, self._config_entry.data.get(CONF_PROCESS_VALUE_ENTITY, "")
-            ),
-            CONF_SETPOINT_ENTITY: o.get(
-                CONF_SETPOINT_ENTITY, self._config_entry.data.get(CONF_SETPOINT_ENTITY, "")
-            ),
-            CONF_OUTPUT_ENTITY: o.get(CONF_OUTPUT_ENTITY, self._config_entry.data.get(CONF_OUTPUT_ENTITY, "")),
-            CONF_GRID_POWER_ENTITY: o.get(
-                CONF_GRID_POWER_ENTITY, self._config_entry.data.get(CONF_GRID_POWER_ENTITY, "")
-            ),
-            CONF_INVERT_PV: o.get(CONF_INVERT_PV, DEFAULT_INVERT_PV),
-            CONF_INVERT_SP: o.get(CONF_INVERT_SP, DEFAULT_INVERT_SP),
-            CONF_GRID_POWER_INVERT: o.get(CONF_GRID_POWER_INVERT, DEFAULT_GRID_POWER_INVERT),
-            CONF_PID_MODE: self._normalize_pid_mode(o.get(CONF_PID_MODE)),
-            CONF_UPDATE_INTERVAL: self._coerce_int(
-                o.get(CONF_UPDATE_INTERVAL),
-                DEFAULT_UPDATE_INTERVAL,
-                min_value=1,
-            ),
-            CONF_PV_MIN: o.get(CONF_PV_MIN, self._config_entry.data.get(CONF_PV_MIN, DEFAULT_PV_MIN)),
-            CONF_PV_MAX: o.get(CONF_PV_MAX, self._config_entry.data.get(CONF_PV_MAX, DEFAULT_PV_MAX)),
-            CONF_SP_MIN: o.get(CONF_SP_MIN, self._config_entry.data.get(CONF_SP_MIN, DEFAULT_SP_MIN)),
-            CONF_SP_MAX: o.get(CONF_SP_MAX, self._config_entry.data.get(CONF_SP_MAX, DEFAULT_SP_MAX)),
-            CONF_GRID_MIN: o.get(CONF_GRID_MIN, self._config_entry.data.get(CONF_GRID_MIN, DEFAULT_GRID_MIN)),
-            CONF_GRID_MAX: o.get(CONF_GRID_MAX, self._config_entry.data.get(CONF_GRID_MAX, DEFAULT_GRID_MAX)),
-        }
+            # Keep previously stored tuning values even though they are no longer exposed in the form.
+            preserved = {key: o.get(key, default) for key, default in _PRESERVED_DEFAULTS.items()}
 
-        if user_input is not None:
-            cleaned = {
-                CONF_PROCESS_VALUE_ENTITY: user_input.get(CONF_PROCESS_VALUE_ENTITY, defaults[CONF_PROCESS_VALUE_ENTITY]),
-                CONF_SETPOINT_ENTITY: user_input.get(CONF_SETPOINT_ENTITY, defaults[CONF_SETPOINT_ENTITY]),
-                CONF_OUTPUT_ENTITY: user_input.get(CONF_OUTPUT_ENTITY, defaults[CONF_OUTPUT_ENTITY]),
-                CONF_GRID_POWER_ENTITY: user_input.get(CONF_GRID_POWER_ENTITY, defaults[CONF_GRID_POWER_ENTITY]),
-                CONF_INVERT_PV: user_input.get(CONF_INVERT_PV, defaults[CONF_INVERT_PV]),
-                CONF_INVERT_SP: user_input.get(CONF_INVERT_SP, defaults[CONF_INVERT_SP]),
-                CONF_GRID_POWER_INVERT: user_input.get(CONF_GRID_POWER_INVERT, defaults[CONF_GRID_POWER_INVERT]),
-                CONF_PID_MODE: user_input.get(CONF_PID_MODE, defaults[CONF_PID_MODE]),
-                CONF_UPDATE_INTERVAL: self._coerce_int(
-                    user_input.get(CONF_UPDATE_INTERVAL),
-                    defaults[CONF_UPDATE_INTERVAL],
-                    min_value=1,
-                ),
-                CONF_PV_MIN: user_input.get(CONF_PV_MIN, defaults[CONF_PV_MIN]),
-                CONF_PV_MAX: user_input.get(CONF_PV_MAX, defaults[CONF_PV_MAX]),
-                CONF_SP_MIN: user_input.get(CONF_SP_MIN, defaults[CONF_SP_MIN]),
-                CONF_SP_MAX: user_input.get(CONF_SP_MAX, defaults[CONF_SP_MAX]),
-                CONF_GRID_MIN: user_input.get(CONF_GRID_MIN, defaults[CONF_GRID_MIN]),
-                CONF_GRID_MAX: user_input.get(CONF_GRID_MAX, defaults[CONF_GRID_MAX]),
-            }
+            # The form schema has already coerced the submitted values (the
+            # update interval to an int >= 1) and filled in the rendered
+            # default for every field left out
+            cleaned = {key: user_input[key] for key in _OPTIONS_FORM_KEYS}
 
             pv_domain = _extract_domain(cleaned[CONF_PROCESS_VALUE_ENTITY])
             sp_domain = _extract_domain(cleaned[CONF_SETPOINT_ENTITY])
@@ -382,33 +390,17 @@ class SolarEnergyFlowOptionsFlowHandler(config_entries.OptionsFlow):
             if grid_domain not in _GRID_DOMAINS:
                 errors[CONF_GRID_POWER_ENTITY] = "invalid_grid_domain"
 
-            max_output_step = preserved.get(CONF_MAX_OUTPUT_STEP, DEFAULT_MAX_OUTPUT_STEP)
-            output_epsilon = preserved.get(CONF_OUTPUT_EPSILON, DEFAULT_OUTPUT_EPSILON)
-
-            try:
-                max_output_step_val = float(max_output_step)
-            except (TypeError, ValueError):
-                errors["base"] = "invalid_max_output_step"
-            else:
-                if max_output_step_val < 0:
-                    errors["base"] = "invalid_max_output_step"
+            for key, non_negative_error in _NON_NEGATIVE:
+                if not _validate_non_negative(preserved[key]):
+                    errors["base"] = non_negative_error
+                    break
 
             if "base" not in errors:
-                try:
-                    output_epsilon_val = float(output_epsilon)
-                except (TypeError, ValueError):
-                    errors["base"] = "invalid_output_epsilon"
-                else:
-                    if output_epsilon_val < 0:
-                        errors["base"] = "invalid_output_epsilon"
-
-            if "base" not in errors:
-                if not self._validate_range(cleaned[CONF_PV_MIN], cleaned[CONF_PV_MAX]):
-                    errors["base"] = "invalid_pv_range"
-                elif not self._validate_range(cleaned[CONF_SP_MIN], cleaned[CONF_SP_MAX]):
-                    errors["base"] = "invalid_sp_range"
-                elif not self._validate_range(cleaned[CONF_GRID_MIN], cleaned[CONF_GRID_MAX]):
-                    errors["base"] = "invalid_grid_range"
+                # The form schema has already coerced the range bounds to float
+                for min_key, max_key, range_error in _RANGES:
+                    if cleaned[max_key] <= cleaned[min_key]:
+                        errors["base"] = range_error
+                        break
 
             if not errors:
                 # Test connection: verify all entities exist and are accessible
@@ -425,7 +417,7 @@ class SolarEnergyFlowOptionsFlowHandler(config_entries.OptionsFlow):
                         pv_state = self.hass.states.get(pv_entity)
                         if pv_state is None:
                             errors[CONF_PROCESS_VALUE_ENTITY] = "entity_not_found"
-                        elif pv_state.state in ("unavailable", "unknown"):
+                        elif pv_state.state in _UNAVAILABLE_STATES:
                             errors[CONF_PROCESS_VALUE_ENTITY] = "entity_unavailable"
 
                     if not sp_entity:
@@ -434,7 +426,7 @@ class SolarEnergyFlowOptionsFlowHandler(config_entries.OptionsFlow):
                         sp_state = self.hass.states.get(sp_entity)
                         if sp_state is None:
                             errors[CONF_SETPOINT_ENTITY] = "entity_not_found"
-                        elif sp_state.state in ("unavailable", "unknown"):
+                        elif sp_state.state in _UNAVAILABLE_STATES:
                             errors[CONF_SETPOINT_ENTITY] = "entity_unavailable"
 
                     if not output_entity:
@@ -443,7 +435,7 @@ class SolarEnergyFlowOptionsFlowHandler(config_entries.OptionsFlow):
                         output_state = self.hass.states.get(output_entity)
                         if output_state is None:
                             errors[CONF_OUTPUT_ENTITY] = "entity_not_found"
-                        elif output_state.state in ("unavailable", "unknown"):
+                        elif output_state.state in _UNAVAILABLE_STATES:
                             errors[CONF_OUTPUT_ENTITY] = "entity_unavailable"
 
                     if not grid_entity:
@@ -452,7 +444,7 @@ class SolarEnergyFlowOptionsFlowHandler(config_entries.OptionsFlow):
                         grid_state = self.hass.states.get(grid_entity)
                         if grid_state is None:
                             errors[CONF_GRID_POWER_ENTITY] = "entity_not_found"
-                        elif grid_state.state in ("unavailable", "unknown"):
+                        elif grid_state.state in _UNAVAILABLE_STATES:
                             errors[CONF_GRID_POWER_ENTITY] = "entity_unavailable"
                 except KeyError as e:
                     # Missing required field
@@ -466,17 +458,13 @@ class SolarEnergyFlowOptionsFlowHandler(config_entries.OptionsFlow):
                     _LOGGER.exception("Error validating entities: %s", e)
                     errors["base"] = "connection_failed"
 
-            if errors:
-                return self.async_show_form(
-                    step_id="init",
-                    data_schema=self._build_schema(defaults),
-                    errors=errors,
-                )
-
-            return self.async_create_entry(title="", data={**preserved, **cleaned})
+            if not errors:
+                # preserved is a fresh dict and its keys never overlap the form's
+                preserved.update(cleaned)
+                return self.async_create_entry(title="", data=preserved)
 
         return self.async_show_form(
             step_id="init",
-            data_schema=self._build_schema(defaults),
+            data_schema=self._build_schema(self._form_defaults()),
             errors=errors,
         )
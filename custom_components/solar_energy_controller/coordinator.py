@@ -94,8 +94,19 @@ _LOGGER = logging.getLogger(__name__)
 
 _OUTPUT_DOMAINS = {"number", "input_number"}
 
+# Options that change how inputs/outputs are wired; changing any of them reloads the entry
+_WIRING_KEYS = (
+    CONF_PROCESS_VALUE_ENTITY,
+    CONF_SETPOINT_ENTITY,
+    CONF_OUTPUT_ENTITY,
+    CONF_GRID_POWER_ENTITY,
+    CONF_INVERT_PV,
+    CONF_INVERT_SP,
+    CONF_GRID_POWER_INVERT,
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class FlowState:
     pv: float | None
     sp: float | None
@@ -331,7 +342,8 @@ async def _set_output(hass: HomeAssistant, entity_id: str, value: float) -> bool
     return True
 
 
-def _get_entity_id(entry: ConfigEntry, key: str) -> str | None:
+def get_entity_id(entry: ConfigEntry, key: str) -> str | None:
+    """Return the entity configured for key, preferring the entry options."""
     return entry.options.get(key) or entry.data.get(key)
 
 
@@ -395,10 +407,12 @@ class SolarEnergyFlowCoordinator(DataUpdateCoordinator[FlowState]):
         # Store last auto values for display when in manual modes
         self._last_auto_sp_value: float | None = None
         self._last_auto_out_value: float | None = None
+        # Options used by the most recent update, exposed for diagnostics
+        self.runtime_options: RuntimeOptions = self._build_runtime_options()
 
     def _get_normal_setpoint_value(self) -> float | None:
         """Return the current external setpoint with inversion applied (no limiter)."""
-        sp_ent = _get_entity_id(self.entry, CONF_SETPOINT_ENTITY)
+        sp_ent = get_entity_id(self.entry, CONF_SETPOINT_ENTITY)
         sp = _state_to_float(self.hass.states.get(sp_ent), sp_ent) if sp_ent else None
         if sp is not None and self.entry.options.get(CONF_INVERT_SP, DEFAULT_INVERT_SP):
             sp = -sp
@@ -516,8 +530,8 @@ class SolarEnergyFlowCoordinator(DataUpdateCoordinator[FlowState]):
         )
 
     def _read_inputs(self, options: RuntimeOptions) -> InputValues:
-        pv_ent = _get_entity_id(self.entry, CONF_PROCESS_VALUE_ENTITY)
-        grid_ent = _get_entity_id(self.entry, CONF_GRID_POWER_ENTITY)
+        pv_ent = get_entity_id(self.entry, CONF_PROCESS_VALUE_ENTITY)
+        grid_ent = get_entity_id(self.entry, CONF_GRID_POWER_ENTITY)
 
         pv_state = self.hass.states.get(pv_ent) if pv_ent else None
         pv = _state_to_float(pv_state, pv_ent) if pv_ent else None
@@ -533,7 +547,7 @@ class SolarEnergyFlowCoordinator(DataUpdateCoordinator[FlowState]):
             grid_power = -grid_power
 
         sp = self._get_normal_setpoint_value()
-        sp_ent = _get_entity_id(self.entry, CONF_SETPOINT_ENTITY)
+        sp_ent = get_entity_id(self.entry, CONF_SETPOINT_ENTITY)
         sp_state = self.hass.states.get(sp_ent) if sp_ent else None
         sp_available = sp_state is not None and sp_state.state not in ("unavailable", "unknown")
 
@@ -832,20 +846,7 @@ class SolarEnergyFlowCoordinator(DataUpdateCoordinator[FlowState]):
         )
 
     def options_require_reload(self, old: Mapping[str, Any], new: Mapping[str, Any]) -> bool:
-        wiring_keys = {
-            CONF_PROCESS_VALUE_ENTITY,
-            CONF_SETPOINT_ENTITY,
-            CONF_OUTPUT_ENTITY,
-            CONF_GRID_POWER_ENTITY,
-            CONF_INVERT_PV,
-            CONF_INVERT_SP,
-            CONF_GRID_POWER_INVERT,
-        }
-
-        for key in wiring_keys:
-            if old.get(key) != new.get(key):
-                return True
-        return False
+        return any(old.get(key) != new.get(key) for key in _WIRING_KEYS)
     
     def apply_options(self, options: Mapping[str, Any]) -> None:
         """Apply runtime tuning without resetting PID state."""
@@ -1102,11 +1103,12 @@ class SolarEnergyFlowCoordinator(DataUpdateCoordinator[FlowState]):
         prev_manual_sp_value = self._manual_sp_value
 
         options = self._build_runtime_options()
+        self.runtime_options = options
         inputs = self._read_inputs(options)
         setpoint_context = self._compute_setpoint_context(options, inputs, prev_runtime_mode, prev_manual_sp_value)
         limiter_result = self._apply_grid_limiter(options, inputs, setpoint_context, prev_limiter_state)
 
-        out_ent = _get_entity_id(self.entry, CONF_OUTPUT_ENTITY)
+        out_ent = get_entity_id(self.entry, CONF_OUTPUT_ENTITY)
         out_state = self.hass.states.get(out_ent) if out_ent else None
         out_available = out_state is not None and out_state.state not in ("unavailable", "unknown")
         
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import asdict
+import logging
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
@@ -15,7 +18,18 @@ type SolarEnergyControllerConfigEntry = ConfigEntry[SolarEnergyFlowCoordinator]
 
 # No sensitive information to redact - entity IDs are not considered sensitive
 # and there are no passwords, tokens, or coordinates in this integration
-TO_REDACT: list[str] = []
+TO_REDACT: frozenset[str] = frozenset()
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _safe(label: str, build: Callable[[], dict[str, Any]]) -> dict[str, Any] | None:
+    """Build one diagnostics section, returning None if it cannot be collected."""
+    try:
+        return build()
+    except Exception as err:
+        _LOGGER.debug("Could not collect diagnostics section %s: %s", label, err)
+        return None
 
 
 async def async_get_config_entry_diagnostics(
@@ -25,83 +39,26 @@ async def async_get_config_entry_diagnostics(
     coordinator: SolarEnergyFlowCoordinator = entry.runtime_data
 
     # Get current state data
-    current_data = None
-    if coordinator.data:
-        current_data = {
-            "pv": coordinator.data.pv,
-            "sp": coordinator.data.sp,
-            "grid_power": coordinator.data.grid_power,
-            "out": coordinator.data.out,
-            "output_pre_rate_limit": coordinator.data.output_pre_rate_limit,
-            "error": coordinator.data.error,
-            "enabled": coordinator.data.enabled,
-            "status": coordinator.data.status,
-            "limiter_state": coordinator.data.limiter_state,
-            "runtime_mode": coordinator.data.runtime_mode,
-            "manual_sp_value": coordinator.data.manual_sp_value,
-            "manual_out_value": coordinator.data.manual_out_value,
-            "manual_sp_display_value": coordinator.data.manual_sp_display_value,
-            "p_term": coordinator.data.p_term,
-            "i_term": coordinator.data.i_term,
-            "d_term": coordinator.data.d_term,
-        }
+    data = coordinator.data
+    current_data = asdict(data) if data else None
 
     # Get runtime options
-    runtime_options = None
-    try:
-        options = coordinator._build_runtime_options()
-        runtime_options = {
-            "enabled": options.enabled,
-            "min_output": options.min_output,
-            "max_output": options.max_output,
-            "pv_min": options.pv_min,
-            "pv_max": options.pv_max,
-            "sp_min": options.sp_min,
-            "sp_max": options.sp_max,
-            "grid_min": options.grid_min,
-            "grid_max": options.grid_max,
-            "invert_pv": options.invert_pv,
-            "grid_power_invert": options.grid_power_invert,
-            "limiter_enabled": options.limiter_enabled,
-            "limiter_type": options.limiter_type,
-            "limiter_limit_w": options.limiter_limit_w,
-            "limiter_deadband_w": options.limiter_deadband_w,
-            "rate_limiter_enabled": options.rate_limiter_enabled,
-            "rate_limit": options.rate_limit,
-            "pid_deadband": options.pid_deadband,
-            "pid_mode": options.pid_mode,
-            "runtime_mode": options.runtime_mode,
-            "max_output_step": options.max_output_step,
-            "output_epsilon": options.output_epsilon,
-        }
-    except Exception:
-        pass
-
-    # Get PID configuration
-    pid_config = None
-    try:
-        pid_cfg = coordinator.pid.cfg
-        pid_config = {
-            "kp": pid_cfg.kp,
-            "ki": pid_cfg.ki,
-            "kd": pid_cfg.kd,
-            "min_output": pid_cfg.min_output,
-            "max_output": pid_cfg.max_output,
-        }
-    except Exception:
-        pass
-
-    # Get PID internal state
-    pid_state = None
-    try:
-        pid_state = {
-            "integral": coordinator.pid._integral,
-            "prev_pv": coordinator.pid._prev_pv,
-            "prev_t": coordinator.pid._prev_t,  # This is a float (time.monotonic()), not a datetime
-            "prev_error": coordinator.pid._prev_error,
-        }
-    except Exception:
-        pass
+    options = coordinator.runtime_options
+    runtime_options = asdict(options) if options is not None else None
+
+    pid = coordinator.pid
+
+    # Get PID configuration and internal state
+    pid_config = _safe("pid_config", lambda: asdict(pid.cfg))
+    pid_state = _safe(
+        "pid_state",
+        lambda: {
+            "integral": pid._integral,
+            "prev_pv": pid._prev_pv,
+            "prev_t": pid._prev_t,  # This is a float (time.monotonic()), not a datetime
+            "prev_error": pid._prev_error,
+        },
+    )
 
     # Get coordinator metadata
     coordinator_info = {
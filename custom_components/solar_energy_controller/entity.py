@@ -0,0 +1,19 @@
+"""Shared entity helpers for Solar Energy Controller."""
+
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+
+from .const import DOMAIN
+
+
+def build_device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return the DeviceInfo of the controller device for a config entry."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=entry.title,
+        manufacturer="Solar Energy Controller",
+        model="PID Controller",
+        entry_type=DeviceEntryType.SERVICE,
+    )
@@ -4,7 +4,7 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -43,6 +43,7 @@ from .const import (
     RUNTIME_MODE_MANUAL_SP,
 )
 from .coordinator import SolarEnergyFlowCoordinator
+from .entity import build_device_info
 
 type SolarEnergyControllerConfigEntry = ConfigEntry[SolarEnergyFlowCoordinator]
 
@@ -54,6 +55,8 @@ PARALLEL_UPDATES = 0
 async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     coordinator = entry.runtime_data
 
+    # Every number belongs to the same device, so share one DeviceInfo
+    device_info = build_device_info(entry)
     entities: list[NumberEntity] = [
         SolarEnergyFlowNumber(
             coordinator,
@@ -65,6 +68,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerCon
             0.0,
             1000.0,
             EntityCategory.CONFIG,
+            device_info=device_info,
         ),
         SolarEnergyFlowNumber(
             coordinator,
@@ -76,6 +80,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerCon
             0.0,
             1000.0,
             EntityCategory.CONFIG,
+            device_info=device_info,
         ),
         SolarEnergyFlowNumber(
             coordinator,
@@ -87,6 +92,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerCon
             0.0,
             1000.0,
             EntityCategory.CONFIG,
+            device_info=device_info,
         ),
         SolarEnergyFlowNumber(
             coordinator,
@@ -98,6 +104,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerCon
             -20000.0,
             20000.0,
             EntityCategory.CONFIG,
+            device_info=device_info,
         ),
         SolarEnergyFlowNumber(
             coordinator,
@@ -109,6 +116,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerCon
             -20000.0,
             20000.0,
             EntityCategory.CONFIG,
+            device_info=device_info,
         ),
         SolarEnergyFlowNumber(
             coordinator,
@@ -120,6 +128,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerCon
             0.0,
             20000.0,
             EntityCategory.CONFIG,
+            device_info=device_info,
         ),
         SolarEnergyFlowNumber(
             coordinator,
@@ -131,6 +140,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerCon
             0.0,
             20000.0,
             EntityCategory.CONFIG,
+            device_info=device_info,
         ),
         SolarEnergyFlowNumber(
             coordinator,
@@ -142,6 +152,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerCon
             0.0,
             2000.0,
             None,
+            device_info=device_info,
         ),
         SolarEnergyFlowNumber(
             coordinator,
@@ -153,6 +164,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerCon
             0.0,
             10000.0,
             EntityCategory.CONFIG,
+            device_info=device_info,
         ),
         SolarEnergyFlowManualNumber(
             coordinator,
@@ -163,6 +175,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerCon
             1.0,
             -20000.0,
             20000.0,
+            device_info=device_info,
         ),
         SolarEnergyFlowManualNumber(
             coordinator,
@@ -173,6 +186,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerCon
             1.0,
             -20000.0,
             20000.0,
+            device_info=device_info,
         ),
     ]
 
@@ -206,6 +220,8 @@ class SolarEnergyFlowNumber(CoordinatorEntity, NumberEntity):
         max_value: float | None,
         entity_category: EntityCategory | None,
         native_unit: str | None = None,
+        *,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         super().__init__(coordinator)
         self._entry = entry
@@ -218,13 +234,7 @@ class SolarEnergyFlowNumber(CoordinatorEntity, NumberEntity):
         self._attr_native_max_value = max_value
         self._attr_entity_category = entity_category
         self._attr_native_unit_of_measurement = native_unit
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=entry.title,
-            manufacturer="Solar Energy Controller",
-            model="PID Controller",
-            entry_type=DeviceEntryType.SERVICE,
-        )
+        self._attr_device_info = device_info if device_info is not None else build_device_info(entry)
 
     @property
     def native_value(self) -> float:
@@ -286,6 +296,8 @@ class SolarEnergyFlowManualNumber(CoordinatorEntity, NumberEntity):
         step: float,
         min_value: float | None,
         max_value: float | None,
+        *,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         super().__init__(coordinator)
         self._entry = entry
@@ -296,13 +308,7 @@ class SolarEnergyFlowManualNumber(CoordinatorEntity, NumberEntity):
         self._attr_native_step = step
         self._attr_native_min_value = min_value
         self._attr_native_max_value = max_value
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=entry.title,
-            manufacturer="Solar Energy Controller",
-            model="PID Controller",
-            entry_type=DeviceEntryType.SERVICE,
-        )
+        self._attr_device_info = device_info if device_info is not None else build_device_info(entry)
 
     @property
     def native_value(self) -> float:
@@ -78,29 +78,34 @@ class PID:
         else:
             d_pv = (pv - self._prev_pv) / dt
 
-        p = self.cfg.kp * error
+        cfg = self.cfg
+        min_output = cfg.min_output
+        max_output = cfg.max_output
+
+        p = cfg.kp * error
         i = self._integral
-        d = -self.cfg.kd * d_pv
+        d = -cfg.kd * d_pv
 
         u_pid = p + i + d
-        u_sat = max(self.cfg.min_output, min(self.cfg.max_output, u_pid))
+        u_sat = max(min_output, min(max_output, u_pid))
 
-        if rate_limiter_enabled and rate_limit > 0 and last_output is not None and dt > 0:
+        rate_limit_active = rate_limiter_enabled and rate_limit > 0 and last_output is not None
+        if rate_limit_active and dt > 0:
             max_delta = rate_limit * dt
             u_out = max(last_output - max_delta, min(last_output + max_delta, u_sat))
         else:
             u_out = u_sat
 
         if dt > 0:
-            output_saturated = (u_pid < self.cfg.min_output) or (u_pid > self.cfg.max_output)
-            rate_limited = rate_limiter_enabled and rate_limit > 0 and last_output is not None and u_out != u_sat
+            output_saturated = (u_pid < min_output) or (u_pid > max_output)
+            rate_limited = rate_limit_active and u_out != u_sat
             
             if output_saturated or rate_limited:
                 integral_update = 0.0
             else:
-                integral_update = self.cfg.ki * error * dt + self._kaw * (u_out - u_pid) * dt
+                integral_update = cfg.ki * error * dt + self._kaw * (u_out - u_pid) * dt
             
-            output_range = abs(self.cfg.max_output - self.cfg.min_output)
+            output_range = abs(max_output - min_output)
             if output_range > 0:
                 max_integral = output_range * 2.0
                 new_integral = self._integral + integral_update
@@ -1,365 +1,271 @@
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    CONF_KD,
+    CONF_KI,
+    CONF_KP,
+    CONF_MAX_OUTPUT,
+    CONF_MIN_OUTPUT,
+    CONF_PID_DEADBAND,
+    DEFAULT_KD,
+    DEFAULT_KI,
+    DEFAULT_KP,
+    DEFAULT_MAX_OUTPUT,
+    DEFAULT_MIN_OUTPUT,
+    DEFAULT_PID_DEADBAND,
+    DOMAIN,
+    RUNTIME_MODE_AUTO_SP,
+    RUNTIME_MODE_HOLD,
+    RUNTIME_MODE_MANUAL_OUT,
+    RUNTIME_MODE_MANUAL_SP,
+)
 from .coordinator import SolarEnergyFlowCoordinator
+from .entity import build_device_info
 
 type SolarEnergyControllerConfigEntry = ConfigEntry[SolarEnergyFlowCoordinator]
 
 # Coordinator is used to centralize the data updates
 PARALLEL_UPDATES = 0
 
+_RUNTIME_MODES = (
+    RUNTIME_MODE_AUTO_SP,
+    RUNTIME_MODE_MANUAL_SP,
+    RUNTIME_MODE_HOLD,
+    RUNTIME_MODE_MANUAL_OUT,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SolarEnergyFlowSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor that mirrors one FlowState field."""
+
+    # FlowState attribute to expose; key stays the unique_id suffix
+    field: str
+    # Unavailable while the field is None (otherwise None is a valid reading)
+    value_required: bool = False
+    rounded: bool = True
+
+
+SENSORS: tuple[SolarEnergyFlowSensorEntityDescription, ...] = (
+    SolarEnergyFlowSensorEntityDescription(
+        key="effective_sp",
+        name="Effective SP",
+        icon="mdi:target-variant",
+        field="sp",
+        value_required=True,
+    ),
+    SolarEnergyFlowSensorEntityDescription(
+        key="pv_value",
+        name="PV value",
+        icon="mdi:gauge",
+        field="pv",
+        value_required=True,
+    ),
+    SolarEnergyFlowSensorEntityDescription(
+        key="output",
+        name="Output",
+        icon="mdi:tune-vertical",
+        field="out",
+        value_required=True,
+    ),
+    SolarEnergyFlowSensorEntityDescription(
+        key="error",
+        name="Error",
+        icon="mdi:delta",
+        field="error",
+    ),
+    SolarEnergyFlowSensorEntityDescription(
+        key="grid_power",
+        name="Grid power",
+        icon="mdi:home-lightning-bolt-outline",
+        field="grid_power",
+    ),
+    SolarEnergyFlowSensorEntityDescription(
+        key="p_term",
+        name="P term",
+        icon="mdi:alpha-p-circle-outline",
+        field="p_term",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SolarEnergyFlowSensorEntityDescription(
+        key="i_term",
+        name="I term",
+        icon="mdi:alpha-i-circle-outline",
+        field="i_term",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SolarEnergyFlowSensorEntityDescription(
+        key="d_term",
+        name="D term",
+        icon="mdi:alpha-d-circle-outline",
+        field="d_term",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SolarEnergyFlowSensorEntityDescription(
+        key="limiter_state",
+        name="Limiter state",
+        icon="mdi:flash-outline",
+        field="limiter_state",
+        value_required=True,
+        rounded=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SolarEnergyFlowSensorEntityDescription(
+        key="output_pre_rate_limit",
+        name="Output (pre rate limit)",
+        icon="mdi:tune-vertical",
+        field="output_pre_rate_limit",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+)
+
+STATUS_SENSOR = SensorEntityDescription(
+    key="status",
+    name="Status",
+    icon="mdi:information-outline",
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: SolarEnergyControllerConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     coordinator = entry.runtime_data
-    async_add_entities(
-        [
-            SolarEnergyFlowEffectiveSPSensor(coordinator, entry),
-            SolarEnergyFlowPVValueSensor(coordinator, entry),
-            SolarEnergyFlowOutputSensor(coordinator, entry),
-            SolarEnergyFlowErrorSensor(coordinator, entry),
-            SolarEnergyFlowStatusSensor(coordinator, entry),
-            SolarEnergyFlowGridPowerSensor(coordinator, entry),
-            SolarEnergyFlowPTermSensor(coordinator, entry),
-            SolarEnergyFlowITermSensor(coordinator, entry),
-            SolarEnergyFlowDTermSensor(coordinator, entry),
-            SolarEnergyFlowLimiterStateSensor(coordinator, entry),
-            SolarEnergyFlowOutputPreRateLimitSensor(coordinator, entry),
-        ]
-    )
+    # Every sensor belongs to the same device, so share one DeviceInfo
+    device_info = build_device_info(entry)
+    entities: list[SensorEntity] = [
+        SolarEnergyFlowFieldSensor(coordinator, entry, description, device_info=device_info)
+        for description in SENSORS
+    ]
+    entities.append(SolarEnergyFlowStatusSensor(coordinator, entry, device_info=device_info))
+    async_add_entities(entities)
 
 
 class _BaseFlowSensor(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
+    # FlowState field that must be set for the sensor to be available
+    _required_field: str | None = None
 
     def __init__(
         self,
         coordinator: SolarEnergyFlowCoordinator,
         entry: ConfigEntry,
-        name: str,
-        unique_suffix: str,
-        entity_category: EntityCategory | None = None,
+        description: SensorEntityDescription,
+        *,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         super().__init__(coordinator)
         self._entry = entry
-        self._attr_name = name
-        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{unique_suffix}"
-        if entity_category is not None:
-            self._attr_entity_category = entity_category
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=entry.title,
-            manufacturer="Solar Energy Controller",
-            model="PID Controller",
-            entry_type=DeviceEntryType.SERVICE,
-        )
-
-    @property
-    def _data(self):
-        return getattr(self.coordinator, "data", None)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        data = self._data
-        return data is not None
-
-
-class SolarEnergyFlowEffectiveSPSensor(_BaseFlowSensor):
-    _attr_icon = "mdi:target-variant"
-
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry, "Effective SP", "effective_sp")
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        data = self._data
-        return data is not None and getattr(data, "sp", None) is not None
-
-    @property
-    def native_value(self):
-        data = self._data
-        value = getattr(data, "sp", None)
-        return round(value, 1) if value is not None else None
-
-
-class SolarEnergyFlowPVValueSensor(_BaseFlowSensor):
-    _attr_icon = "mdi:gauge"
-
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry, "PV value", "pv_value")
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{description.key}"
+        self._attr_device_info = device_info if device_info is not None else build_device_info(entry)
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        if not super().available:
+        if not super().available or (data := self.coordinator.data) is None:
             return False
-        data = self._data
-        return data is not None and getattr(data, "pv", None) is not None
+        return self._required_field is None or getattr(data, self._required_field) is not None
 
-    @property
-    def native_value(self):
-        data = self._data
-        value = getattr(data, "pv", None)
-        return round(value, 1) if value is not None else None
 
+class SolarEnergyFlowFieldSensor(_BaseFlowSensor):
+    """Sensor exposing a single FlowState field."""
 
-class SolarEnergyFlowOutputSensor(_BaseFlowSensor):
-    _attr_icon = "mdi:tune-vertical"
+    entity_description: SolarEnergyFlowSensorEntityDescription
 
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry, "Output", "output")
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        data = self._data
-        return data is not None and getattr(data, "out", None) is not None
+    def __init__(
+        self,
+        coordinator: SolarEnergyFlowCoordinator,
+        entry: ConfigEntry,
+        description: SolarEnergyFlowSensorEntityDescription,
+        *,
+        device_info: DeviceInfo | None = None,
+    ) -> None:
+        super().__init__(coordinator, entry, description, device_info=device_info)
+        if description.value_required:
+            self._required_field = description.field
 
     @property
     def native_value(self):
-        data = self._data
-        out = getattr(data, "out", None) if data else None
-        return round(out, 1) if out is not None else None
+        data = self.coordinator.data
+        if data is None:
+            return None
+        value = getattr(data, self.entity_description.field)
+        if value is None or not self.entity_description.rounded:
+            return value
+        return round(value, 1)
 
 
-class SolarEnergyFlowErrorSensor(_BaseFlowSensor):
-    _attr_icon = "mdi:delta"
+class SolarEnergyFlowStatusSensor(_BaseFlowSensor):
+    _required_field = "status"
 
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry, "Error", "error")
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        data = self._data
-        # Error can be None when PV or SP is missing, which is valid
-        return data is not None
+    def __init__(self, coordinator, entry: ConfigEntry, *, device_info: DeviceInfo | None = None) -> None:
+        super().__init__(coordinator, entry, STATUS_SENSOR, device_info=device_info)
+        self._attrs: dict = {}
 
     @property
     def native_value(self):
-        data = self._data
-        value = getattr(data, "error", None)
-        return round(value, 1) if value is not None else None
-
-
-class SolarEnergyFlowStatusSensor(_BaseFlowSensor):
-    _attr_icon = "mdi:information-outline"
-
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry, "Status", "status")
+        data = self.coordinator.data
+        return data.status if data is not None else None
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        data = self._data
-        return data is not None and getattr(data, "status", None) is not None
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._attrs = self._build_attrs()
 
-    @property
-    def native_value(self):
-        data = self._data
-        return getattr(data, "status", None)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Option changes are applied through a coordinator refresh, so one
+        # rebuild per update also keeps the option-derived attributes current
+        self._attrs = self._build_attrs()
+        super()._handle_coordinator_update()
 
     @property
     def extra_state_attributes(self):
         """Expose all PID data as attributes for the custom card."""
-        data = self._data
+        return self._attrs
+
+    def _build_attrs(self) -> dict:
+        data = self.coordinator.data
         if not data:
             return {}
-        
-        # Get runtime options from coordinator
-        options = self.coordinator._build_runtime_options()
-        
-        # Get values from entry options
-        from .const import (
-            CONF_KP, CONF_KI, CONF_KD, CONF_MIN_OUTPUT, CONF_MAX_OUTPUT,
-            CONF_PID_DEADBAND,
-            DEFAULT_KP, DEFAULT_KI, DEFAULT_KD, DEFAULT_MIN_OUTPUT, DEFAULT_MAX_OUTPUT,
-            DEFAULT_PID_DEADBAND,
-            RUNTIME_MODE_AUTO_SP, RUNTIME_MODE_MANUAL_SP, RUNTIME_MODE_HOLD, RUNTIME_MODE_MANUAL_OUT,
-        )
-        
+
+        entry_options = self._entry.options
+        # Options used by the most recent coordinator update
+        options = self.coordinator.runtime_options
+
         return {
+            "runtime_modes": _RUNTIME_MODES,
+            "kp": entry_options.get(CONF_KP, DEFAULT_KP),
+            "ki": entry_options.get(CONF_KI, DEFAULT_KI),
+            "kd": entry_options.get(CONF_KD, DEFAULT_KD),
+            "deadband": entry_options.get(CONF_PID_DEADBAND, DEFAULT_PID_DEADBAND),
+            "min_output": entry_options.get(CONF_MIN_OUTPUT, DEFAULT_MIN_OUTPUT),
+            "max_output": entry_options.get(CONF_MAX_OUTPUT, DEFAULT_MAX_OUTPUT),
             "enabled": options.enabled,
             "runtime_mode": options.runtime_mode,
-            "runtime_modes": [
-                RUNTIME_MODE_AUTO_SP,
-                RUNTIME_MODE_MANUAL_SP,
-                RUNTIME_MODE_HOLD,
-                RUNTIME_MODE_MANUAL_OUT,
-            ],
-            "pv_value": getattr(data, "pv", None),
-            "effective_sp": getattr(data, "sp", None),
-            "error": getattr(data, "error", None),
-            "output": getattr(data, "out", None),
-            "status": getattr(data, "status", None),
-            "p_term": getattr(data, "p_term", None),
-            "i_term": getattr(data, "i_term", None),
-            "d_term": getattr(data, "d_term", None),
-            "grid_power": getattr(data, "grid_power", None),
-            "kp": self._entry.options.get(CONF_KP, DEFAULT_KP),
-            "ki": self._entry.options.get(CONF_KI, DEFAULT_KI),
-            "kd": self._entry.options.get(CONF_KD, DEFAULT_KD),
-            "deadband": self._entry.options.get(CONF_PID_DEADBAND, DEFAULT_PID_DEADBAND),
-            "min_output": self._entry.options.get(CONF_MIN_OUTPUT, DEFAULT_MIN_OUTPUT),
-            "max_output": self._entry.options.get(CONF_MAX_OUTPUT, DEFAULT_MAX_OUTPUT),
+            "pv_value": data.pv,
+            "effective_sp": data.sp,
+            "error": data.error,
+            "output": data.out,
+            "status": data.status,
+            "p_term": data.p_term,
+            "i_term": data.i_term,
+            "d_term": data.d_term,
+            "grid_power": data.grid_power,
             "manual_out": self.coordinator.get_manual_out_value(),
             "manual_sp": self.coordinator.get_manual_sp_value(),
-            "limiter_state": getattr(data, "limiter_state", None),
-            "output_pre_rate_limit": getattr(data, "output_pre_rate_limit", None),
+            "limiter_state": data.limiter_state,
+            "output_pre_rate_limit": data.output_pre_rate_limit,
         }
-
-
-class SolarEnergyFlowGridPowerSensor(_BaseFlowSensor):
-    _attr_icon = "mdi:home-lightning-bolt-outline"
-
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry, "Grid power", "grid_power")
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        data = self._data
-        # Grid power can be None if grid sensor is unavailable, which is valid
-        return data is not None
-
-    @property
-    def native_value(self):
-        data = self._data
-        value = getattr(data, "grid_power", None)
-        return round(value, 1) if value is not None else None
-
-
-class SolarEnergyFlowPTermSensor(_BaseFlowSensor):
-    _attr_icon = "mdi:alpha-p-circle-outline"
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry, "P term", "p_term", EntityCategory.DIAGNOSTIC)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        data = self._data
-        # P term can be None when PID is not active, which is valid
-        return data is not None
-
-    @property
-    def native_value(self):
-        data = self._data
-        value = getattr(data, "p_term", None)
-        return round(value, 1) if value is not None else None
-
-
-class SolarEnergyFlowITermSensor(_BaseFlowSensor):
-    _attr_icon = "mdi:alpha-i-circle-outline"
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry, "I term", "i_term", EntityCategory.DIAGNOSTIC)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        data = self._data
-        # I term can be None when PID is not active, which is valid
-        return data is not None
-
-    @property
-    def native_value(self):
-        data = self._data
-        value = getattr(data, "i_term", None)
-        return round(value, 1) if value is not None else None
-
-
-class SolarEnergyFlowDTermSensor(_BaseFlowSensor):
-    _attr_icon = "mdi:alpha-d-circle-outline"
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry, "D term", "d_term", EntityCategory.DIAGNOSTIC)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        data = self._data
-        # D term can be None when PID is not active, which is valid
-        return data is not None
-
-    @property
-    def native_value(self):
-        data = self._data
-        value = getattr(data, "d_term", None)
-        return round(value, 1) if value is not None else None
-
-
-class SolarEnergyFlowLimiterStateSensor(_BaseFlowSensor):
-    _attr_icon = "mdi:flash-outline"
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator, entry, "Limiter state", "limiter_state", EntityCategory.DIAGNOSTIC)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        data = self._data
-        return data is not None and getattr(data, "limiter_state", None) is not None
-
-    @property
-    def native_value(self):
-        data = self._data
-        return getattr(data, "limiter_state", None)
-
-
-class SolarEnergyFlowOutputPreRateLimitSensor(_BaseFlowSensor):
-    _attr_icon = "mdi:tune-vertical"
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(
-            coordinator, entry, "Output (pre rate limit)", "output_pre_rate_limit", EntityCategory.DIAGNOSTIC
-        )
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        data = self._data
-        # Output pre rate limit can be None when output is not calculated, which is valid
-        return data is not None
-
-    @property
-    def native_value(self):
-        data = self._data
-        value = getattr(data, "output_pre_rate_limit", None)
-        return round(value, 1) if value is not None else None
@@ -867,6 +867,21 @@ async def test_options_flow_preserves_values(hass: HomeAssistant) -> None:
     assert entry.options.get("enabled") is True
 
 
+async def test_options_flow_reuses_schema(hass: HomeAssistant) -> None:
+    """Test the options form schema is reused while the defaults are unchanged."""
+    entry = await _create_test_entry(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result2 = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result2["data_schema"] is result["data_schema"]
+
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_PV_MIN: -10.0}
+    )
+    result3 = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result3["data_schema"] is not result["data_schema"]
+
+
 async def _create_test_entry(hass: HomeAssistant) -> config_entries.ConfigEntry:
     """Helper to create a test config entry."""
     _setup_test_entities(hass)
@@ -124,7 +124,7 @@ def mock_coordinator(mock_entry):
         max_output_step=100.0,
         output_epsilon=1.0,
     )
-    coordinator._build_runtime_options = MagicMock(return_value=mock_options)
+    coordinator.runtime_options = mock_options
     
     # Mock PID
     from custom_components.solar_energy_controller.pid import PIDConfig
@@ -212,16 +212,16 @@ async def test_diagnostics_without_data(hass: HomeAssistant, mock_entry, mock_co
     assert "pid_state" in result
 
 
-async def test_diagnostics_runtime_options_exception(hass: HomeAssistant, mock_entry, mock_coordinator) -> None:
-    """Test diagnostics when _build_runtime_options raises an exception."""
-    mock_coordinator._build_runtime_options = MagicMock(side_effect=Exception("Test error"))
+async def test_diagnostics_runtime_options_missing(hass: HomeAssistant, mock_entry, mock_coordinator) -> None:
+    """Test diagnostics when the coordinator has no runtime options yet."""
+    mock_coordinator.runtime_options = None
     mock_entry.runtime_data = mock_coordinator
     
     result = await async_get_config_entry_diagnostics(hass, mock_entry)
     
-    # Should handle exception gracefully
     assert "runtime_options" in result
     assert result["runtime_options"] is None
+    mock_coordinator._build_runtime_options.assert_not_called()
 
 
 async def test_diagnostics_pid_config_exception(hass: HomeAssistant, mock_entry, mock_coordinator) -> None:
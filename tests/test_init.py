@@ -1,13 +1,21 @@
 """Test the __init__ module."""
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 
 import pytest
 from homeassistant.config_entries import ConfigEntry, ConfigEntryError, ConfigEntryNotReady
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CoreState, HomeAssistant
 
-from custom_components.solar_energy_controller import DOMAIN, async_setup, async_setup_entry, async_unload_entry
+from custom_components.solar_energy_controller import (
+    DOMAIN,
+    _get_frontend_info,
+    _read_manifest_version,
+    _register_resources,
+    async_setup,
+    async_setup_entry,
+    async_unload_entry,
+)
 from custom_components.solar_energy_controller.const import (
     CONF_GRID_POWER_ENTITY,
     CONF_OUTPUT_ENTITY,
@@ -20,7 +28,11 @@ from custom_components.solar_energy_controller.const import (
 def mock_hass():
     """Create a mock Home Assistant instance."""
     hass = MagicMock(spec=HomeAssistant)
+    # Instance attribute, so the spec alone does not provide it
+    hass.state = CoreState.not_running
     hass.states = MagicMock()
+    hass.data = {}
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
     hass.http = MagicMock()
     hass.http.async_register_static_paths = AsyncMock()
     hass.bus = MagicMock()
@@ -52,19 +64,22 @@ def mock_entry():
 
 async def test_async_setup(mock_hass):
     """Test async_setup function."""
-    with patch("os.path.isdir", return_value=True), patch("os.path.dirname", return_value="/test/path"):
+    with patch("os.path.isdir", return_value=True), patch(
+        "custom_components.solar_energy_controller._FRONTEND_PATH", "/test/path/frontend"
+    ):
         result = await async_setup(mock_hass, {})
         
         assert result is True
         mock_hass.http.async_register_static_paths.assert_called_once()
+        path_config = mock_hass.http.async_register_static_paths.call_args[0][0][0]
+        assert path_config.path == "/test/path/frontend"
         mock_hass.bus.async_listen_once.assert_called_once()
 
 
 async def test_async_setup_entry_success(mock_hass, mock_entry):
     """Test successful async_setup_entry."""
     # Setup mock states
-    mock_hass.states.__contains__ = MagicMock(return_value=True)
-    mock_hass.states.__getitem__ = MagicMock(return_value=MagicMock(state="100"))
+    mock_hass.states.get = MagicMock(return_value=MagicMock(state="100"))
     
     # Mock coordinator
     with patch("custom_components.solar_energy_controller.SolarEnergyFlowCoordinator") as mock_coordinator_class:
@@ -82,6 +97,8 @@ async def test_async_setup_entry_success(mock_hass, mock_entry):
             
             assert result is True
             assert mock_entry.runtime_data == mock_coordinator
+            # One state machine lookup per required entity
+            assert mock_hass.states.get.call_count == 4
             mock_coordinator.async_config_entry_first_refresh.assert_called_once()
             mock_hass.config_entries.async_forward_entry_setups.assert_called_once()
 
@@ -107,6 +124,16 @@ async def test_async_setup_entry_missing_entities(mock_hass, mock_entry):
             await async_setup_entry(mock_hass, mock_entry)
 
 
+async def test_async_setup_entry_missing_entity_labels(mock_hass, mock_entry):
+    """Test that the setup error names only the missing entities."""
+    mock_hass.states.get = MagicMock(
+        side_effect=lambda entity_id: None if entity_id in ("number.sp", "sensor.grid") else MagicMock(state="1")
+    )
+
+    with pytest.raises(ConfigEntryError, match=r"not found: Setpoint, Grid Power\."):
+        await async_setup_entry(mock_hass, mock_entry)
+
+
 async def test_async_setup_entry_unavailable_entities(mock_hass, mock_entry):
     """Test async_setup_entry with unavailable entities."""
     # Mock states.get to return a state with "unavailable" status
@@ -132,8 +159,7 @@ async def test_async_setup_entry_unavailable_entities(mock_hass, mock_entry):
 
 async def test_async_setup_entry_coordinator_failure(mock_hass, mock_entry):
     """Test async_setup_entry when coordinator initialization fails."""
-    mock_hass.states.__contains__ = MagicMock(return_value=True)
-    mock_hass.states.__getitem__ = MagicMock(return_value=MagicMock(state="100"))
+    mock_hass.states.get = MagicMock(return_value=MagicMock(state="100"))
     
     with patch("custom_components.solar_energy_controller.SolarEnergyFlowCoordinator") as mock_coordinator_class:
         mock_coordinator = MagicMock()
@@ -155,7 +181,9 @@ async def test_async_unload_entry(mock_hass, mock_entry):
 
 async def test_async_setup_frontend_path_registration(mock_hass):
     """Test that frontend static path is registered when frontend directory exists."""
-    with patch("os.path.isdir", return_value=True), patch("os.path.dirname", return_value="/test/path"):
+    with patch("os.path.isdir", return_value=True), patch(
+        "custom_components.solar_energy_controller._FRONTEND_PATH", "/test/path/frontend"
+    ):
         result = await async_setup(mock_hass, {})
         
         assert result is True
@@ -171,7 +199,43 @@ async def test_async_setup_frontend_path_registration(mock_hass):
         assert len(path_configs) == 1
         path_config = path_configs[0]
         assert path_config.url_path == f"/{DOMAIN}/frontend"
-        assert path_config.cache_headers is False
+        assert path_config.path == "/test/path/frontend"
+        assert path_config.cache_headers is True
+
+
+async def test_async_setup_registers_resources_when_running(mock_hass):
+    """Test that Lovelace resources are registered directly if HA is already running."""
+    mock_hass.state = CoreState.running
+    mock_hass.async_create_background_task = MagicMock()
+    with patch("os.path.isdir", return_value=True):
+        assert await async_setup(mock_hass, {}) is True
+
+    mock_hass.bus.async_listen_once.assert_not_called()
+    mock_hass.async_create_background_task.assert_called_once()
+    mock_hass.async_create_background_task.call_args[0][0].close()
+
+
+async def test_async_setup_registers_resources_after_start(mock_hass):
+    """Test that the started listener schedules registration as a background task."""
+    mock_hass.async_create_background_task = MagicMock()
+    with patch("os.path.isdir", return_value=True):
+        assert await async_setup(mock_hass, {}) is True
+
+    mock_hass.async_create_background_task.assert_not_called()
+    listener = mock_hass.bus.async_listen_once.call_args[0][1]
+    listener(MagicMock())
+
+    mock_hass.async_create_background_task.assert_called_once()
+    mock_hass.async_create_background_task.call_args[0][0].close()
+
+
+async def test_async_setup_static_path_registered_once(mock_hass):
+    """Test that the frontend static path is only registered once per instance."""
+    with patch("os.path.isdir", return_value=True):
+        assert await async_setup(mock_hass, {}) is True
+        assert await async_setup(mock_hass, {}) is True
+
+    mock_hass.http.async_register_static_paths.assert_called_once()
 
 
 async def test_async_setup_frontend_path_missing(mock_hass):
@@ -185,3 +249,95 @@ async def test_async_setup_frontend_path_missing(mock_hass):
         # But should still set up event listener
         mock_hass.bus.async_listen_once.assert_called_once()
 
+
+def test_read_manifest_version_cached():
+    """Test that the manifest version is read from disk only once."""
+    _read_manifest_version.cache_clear()
+    with patch("builtins.open", mock_open(read_data='{"version": "9.9.9"}')) as mocked_open:
+        assert _read_manifest_version() == "9.9.9"
+        assert _read_manifest_version() == "9.9.9"
+
+    mocked_open.assert_called_once()
+    _read_manifest_version.cache_clear()
+
+
+def test_frontend_tokens_follow_card_contents(tmp_path):
+    """Test that a changed card script gets a new version token."""
+    (tmp_path / "pid-controller-mini.js").write_text("v1")
+    (tmp_path / "pid-controller-popup.js").write_text("v1")
+    with patch("custom_components.solar_energy_controller._FRONTEND_PATH", str(tmp_path)):
+        tokens, frontend_path = _get_frontend_info()
+        (tmp_path / "pid-controller-mini.js").write_text("v2")
+        new_tokens, _ = _get_frontend_info()
+
+    assert frontend_path == str(tmp_path)
+    assert new_tokens["pid-controller-mini.js"] != tokens["pid-controller-mini.js"]
+    assert new_tokens["pid-controller-popup.js"] == tokens["pid-controller-popup.js"]
+
+
+async def test_register_resources_skips_existing(mock_hass):
+    """Test that only resources missing from Lovelace are registered."""
+    resources_api = MagicMock()
+    resources_api.async_items = MagicMock(
+        return_value=[{"id": "abc", "url": f"/{DOMAIN}/frontend/pid-controller-mini.js?v=1.0.0"}]
+    )
+    resources_api.async_create_item = AsyncMock()
+    resources_api.async_update_item = AsyncMock()
+    mock_hass.lovelace = MagicMock(mode="storage", resources=resources_api)
+    resources = (
+        {"url": f"/{DOMAIN}/frontend/pid-controller-mini.js?v=1.0.0", "res_type": "module"},
+        {"url": f"/{DOMAIN}/frontend/pid-controller-popup.js?v=1.0.0", "res_type": "module"},
+    )
+
+    await _register_resources(mock_hass, resources)
+
+    resources_api.async_create_item.assert_called_once_with(
+        {"url": f"/{DOMAIN}/frontend/pid-controller-popup.js?v=1.0.0", "res_type": "module"}
+    )
+    resources_api.async_update_item.assert_not_called()
+
+
+async def test_register_resources_updates_stale_version(mock_hass):
+    """Test that a resource registered for an older version is updated in place."""
+    resources_api = MagicMock()
+    resources_api.async_items = MagicMock(
+        return_value=[
+            {"id": "abc", "url": f"/{DOMAIN}/frontend/pid-controller-mini.js?v=0.9.0"},
+            {"id": "def", "url": f"/{DOMAIN}/frontend/pid-controller-popup.js?v=1.0.0"},
+        ]
+    )
+    resources_api.async_create_item = AsyncMock()
+    resources_api.async_update_item = AsyncMock()
+    mock_hass.lovelace = MagicMock(mode="storage", resources=resources_api)
+    resources = (
+        {"url": f"/{DOMAIN}/frontend/pid-controller-mini.js?v=1.0.0", "res_type": "module"},
+        {"url": f"/{DOMAIN}/frontend/pid-controller-popup.js?v=1.0.0", "res_type": "module"},
+    )
+
+    await _register_resources(mock_hass, resources)
+
+    resources_api.async_update_item.assert_called_once_with(
+        "abc", {"url": f"/{DOMAIN}/frontend/pid-controller-mini.js?v=1.0.0"}
+    )
+    resources_api.async_create_item.assert_not_called()
+
+
+async def test_register_resources_all_existing(mock_hass):
+    """Test that nothing is created when every resource is already registered."""
+    resources_api = MagicMock()
+    resources_api.async_items = MagicMock(
+        return_value=[
+            {"id": "abc", "url": f"/{DOMAIN}/frontend/pid-controller-mini.js?v=1.0.0"},
+            {"id": "def", "url": f"/{DOMAIN}/frontend/pid-controller-popup.js?v=1.0.0"},
+        ]
+    )
+    resources_api.async_create_item = AsyncMock()
+    mock_hass.lovelace = MagicMock(mode="storage", resources=resources_api)
+    resources = (
+        {"url": f"/{DOMAIN}/frontend/pid-controller-mini.js?v=1.0.0", "res_type": "module"},
+        {"url": f"/{DOMAIN}/frontend/pid-controller-popup.js?v=1.0.0", "res_type": "module"},
+    )
+
+    await _register_resources(mock_hass, resources)
+
+    resources_api.async_create_item.assert_not_called()
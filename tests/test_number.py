@@ -296,4 +296,6 @@ async def test_async_setup_entry(hass: HomeAssistant, mock_entry):
     assert mock_add_entities.called
     call_args = mock_add_entities.call_args[0][0]
     assert len(call_args) == 11  # Should create 11 number entities (8 config + 2 manual + 1 rate limit)
+    # All numbers share a single DeviceInfo for the entry
+    assert all(entity.device_info is call_args[0].device_info for entity in call_args)
 
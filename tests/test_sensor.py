@@ -2,23 +2,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from custom_components.solar_energy_controller.sensor import (
-    SolarEnergyFlowDTermSensor,
-    SolarEnergyFlowEffectiveSPSensor,
-    SolarEnergyFlowErrorSensor,
-    SolarEnergyFlowGridPowerSensor,
-    SolarEnergyFlowITermSensor,
-    SolarEnergyFlowLimiterStateSensor,
-    SolarEnergyFlowOutputPreRateLimitSensor,
-    SolarEnergyFlowOutputSensor,
-    SolarEnergyFlowPTermSensor,
-    SolarEnergyFlowPVValueSensor,
+    SENSORS,
+    SolarEnergyFlowFieldSensor,
     SolarEnergyFlowStatusSensor,
     async_setup_entry,
 )
@@ -63,10 +55,10 @@ def mock_coordinator():
     type(coordinator).data = mock_data
     # CoordinatorEntity requires last_update_success
     coordinator.last_update_success = True
-    coordinator._build_runtime_options = MagicMock(return_value=MagicMock(
+    coordinator.runtime_options = MagicMock(
         enabled=True,
         runtime_mode="AUTO SP",
-    ))
+    )
     coordinator.get_manual_out_value = MagicMock(return_value=55.0)
     coordinator.get_manual_sp_value = MagicMock(return_value=60.0)
     return coordinator
@@ -89,11 +81,23 @@ def mock_entry():
     return entry
 
 
+def _field_sensor(coordinator, entry, key):
+    description = next(desc for desc in SENSORS if desc.key == key)
+    return SolarEnergyFlowFieldSensor(coordinator, entry, description)
+
+
+def _update(sensor):
+    """Deliver a coordinator update to the sensor without a running hass."""
+    with patch.object(sensor, "async_write_ha_state"):
+        sensor._handle_coordinator_update()
+
+
 def test_effective_sp_sensor(mock_coordinator, mock_entry):
     """Test Effective SP sensor."""
-    sensor = SolarEnergyFlowEffectiveSPSensor(mock_coordinator, mock_entry)
+    sensor = _field_sensor(mock_coordinator, mock_entry, "effective_sp")
     
-    assert sensor._attr_name == "Effective SP"
+    assert sensor.entity_description.name == "Effective SP"
+    assert sensor.unique_id == f"{DOMAIN}_test_entry_123_effective_sp"
     assert sensor.available is True
     assert sensor.native_value == 60.0
     
@@ -105,9 +109,9 @@ def test_effective_sp_sensor(mock_coordinator, mock_entry):
 
 def test_pv_value_sensor(mock_coordinator, mock_entry):
     """Test PV value sensor."""
-    sensor = SolarEnergyFlowPVValueSensor(mock_coordinator, mock_entry)
+    sensor = _field_sensor(mock_coordinator, mock_entry, "pv_value")
     
-    assert sensor._attr_name == "PV value"
+    assert sensor.entity_description.name == "PV value"
     assert sensor.available is True
     assert sensor.native_value == 50.0
     
@@ -119,9 +123,9 @@ def test_pv_value_sensor(mock_coordinator, mock_entry):
 
 def test_output_sensor(mock_coordinator, mock_entry):
     """Test Output sensor."""
-    sensor = SolarEnergyFlowOutputSensor(mock_coordinator, mock_entry)
+    sensor = _field_sensor(mock_coordinator, mock_entry, "output")
     
-    assert sensor._attr_name == "Output"
+    assert sensor.entity_description.name == "Output"
     assert sensor.available is True
     assert sensor.native_value == 55.0
     
@@ -133,9 +137,9 @@ def test_output_sensor(mock_coordinator, mock_entry):
 
 def test_error_sensor(mock_coordinator, mock_entry):
     """Test Error sensor."""
-    sensor = SolarEnergyFlowErrorSensor(mock_coordinator, mock_entry)
+    sensor = _field_sensor(mock_coordinator, mock_entry, "error")
     
-    assert sensor._attr_name == "Error"
+    assert sensor.entity_description.name == "Error"
     assert sensor.available is True
     assert sensor.native_value == 10.0
     
@@ -149,11 +153,12 @@ def test_status_sensor(mock_coordinator, mock_entry):
     """Test Status sensor."""
     sensor = SolarEnergyFlowStatusSensor(mock_coordinator, mock_entry)
     
-    assert sensor._attr_name == "Status"
+    assert sensor.entity_description.name == "Status"
     assert sensor.available is True
     assert sensor.native_value == "running"
     
     # Test extra_state_attributes
+    _update(sensor)
     attrs = sensor.extra_state_attributes
     assert "enabled" in attrs
     assert "runtime_mode" in attrs
@@ -161,58 +166,64 @@ def test_status_sensor(mock_coordinator, mock_entry):
     assert "output" in attrs
 
 
-def test_grid_power_sensor(mock_coordinator, mock_entry):
-    """Test Grid power sensor."""
-    sensor = SolarEnergyFlowGridPowerSensor(mock_coordinator, mock_entry)
-    
-    assert sensor._attr_name == "Grid power"
-    assert sensor.available is True
-    assert sensor.native_value == 100.0
-
+def test_status_sensor_attributes_follow_options(mock_coordinator, mock_entry):
+    """Test option-derived attributes are refreshed with the next coordinator update."""
+    sensor = SolarEnergyFlowStatusSensor(mock_coordinator, mock_entry)
+    _update(sensor)
 
-def test_p_term_sensor(mock_coordinator, mock_entry):
-    """Test P term sensor."""
-    sensor = SolarEnergyFlowPTermSensor(mock_coordinator, mock_entry)
-    
-    assert sensor._attr_name == "P term"
-    assert sensor.available is True
-    assert sensor.native_value == 5.0
+    attrs = sensor.extra_state_attributes
+    assert attrs["kp"] == 1.0
+    assert attrs["max_output"] == 100.0
 
+    mock_entry.options = {**mock_entry.options, "kp": 2.5}
+    _update(sensor)
+    attrs = sensor.extra_state_attributes
+    assert attrs["kp"] == 2.5
+    assert attrs["max_output"] == 100.0
 
-def test_i_term_sensor(mock_coordinator, mock_entry):
-    """Test I term sensor."""
-    sensor = SolarEnergyFlowITermSensor(mock_coordinator, mock_entry)
-    
-    assert sensor._attr_name == "I term"
-    assert sensor.available is True
-    assert sensor.native_value == 3.0
 
+def test_status_sensor_attributes_built_once_per_update(mock_coordinator, mock_entry):
+    """Test attributes are rebuilt only when the coordinator publishes an update."""
+    sensor = SolarEnergyFlowStatusSensor(mock_coordinator, mock_entry)
+    _update(sensor)
 
-def test_d_term_sensor(mock_coordinator, mock_entry):
-    """Test D term sensor."""
-    sensor = SolarEnergyFlowDTermSensor(mock_coordinator, mock_entry)
-    
-    assert sensor._attr_name == "D term"
-    assert sensor.available is True
-    assert sensor.native_value == 2.0
+    attrs = sensor.extra_state_attributes
+    assert sensor.extra_state_attributes is attrs
+    assert mock_coordinator.get_manual_out_value.call_count == 1
 
+    type(mock_coordinator).data = MockFlowState(pv=42.0, status="running")
+    _update(sensor)
+    attrs = sensor.extra_state_attributes
+    assert attrs["pv_value"] == 42.0
+    assert mock_coordinator.get_manual_out_value.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("key", "name", "expected"),
+    [
+        ("grid_power", "Grid power", 100.0),
+        ("p_term", "P term", 5.0),
+        ("i_term", "I term", 3.0),
+        ("d_term", "D term", 2.0),
+        ("limiter_state", "Limiter state", "normal"),
+        ("output_pre_rate_limit", "Output (pre rate limit)", 55.0),
+    ],
+)
+def test_field_sensors(mock_coordinator, mock_entry, key, name, expected):
+    """Test the remaining field sensors."""
+    sensor = _field_sensor(mock_coordinator, mock_entry, key)
 
-def test_limiter_state_sensor(mock_coordinator, mock_entry):
-    """Test Limiter state sensor."""
-    sensor = SolarEnergyFlowLimiterStateSensor(mock_coordinator, mock_entry)
-    
-    assert sensor._attr_name == "Limiter state"
+    assert sensor.entity_description.name == name
     assert sensor.available is True
-    assert sensor.native_value == "normal"
+    assert sensor.native_value == expected
 
 
-def test_output_pre_rate_limit_sensor(mock_coordinator, mock_entry):
-    """Test Output (pre rate limit) sensor."""
-    sensor = SolarEnergyFlowOutputPreRateLimitSensor(mock_coordinator, mock_entry)
-    
-    assert sensor._attr_name == "Output (pre rate limit)"
-    assert sensor.available is True
-    assert sensor.native_value == 55.0
+def test_field_sensor_rounds_value(mock_coordinator, mock_entry):
+    """Test numeric field sensors round to one decimal."""
+    type(mock_coordinator).data = MockFlowState(pv=50.04, limiter_state="normal")
+
+    assert _field_sensor(mock_coordinator, mock_entry, "pv_value").native_value == 50.0
+    assert _field_sensor(mock_coordinator, mock_entry, "limiter_state").native_value == "normal"
 
 
 async def test_async_setup_entry(hass: HomeAssistant, mock_entry):
@@ -227,4 +238,6 @@ async def test_async_setup_entry(hass: HomeAssistant, mock_entry):
     assert mock_add_entities.called
     call_args = mock_add_entities.call_args[0][0]
     assert len(call_args) == 11  # Should create 11 sensor entities
+    # All sensors share a single DeviceInfo for the entry
+    assert all(entity.device_info is call_args[0].device_info for entity in call_args)
 